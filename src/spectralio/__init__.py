@@ -18,6 +18,7 @@ I/O operations for working with spectral data in python.
 from .reading import (
     read_spec1D,
     read_group,
+    read_group_batch,
     read_spec3D,
     read_wvl,
     read_geodata,
@@ -39,6 +40,7 @@ from .spec3D_models import Spectrum3D, GeoSpectrum3D
 __all__ = [
     "read_spec1D",
     "read_group",
+    "read_group_batch",
     "read_spec3D",
     "read_wvl",
     "read_geodata",
@@ -0,0 +1,49 @@
+# Standard Libraries
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence
+
+# Relative Imports
+from .custom_types import PathLike, Path
+
+# Below this many files the thread pool setup costs more than it saves.
+BATCH_THRESHOLD = 8
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def run_batch[T](
+    fn: Callable[..., T],
+    *arg_seqs: Sequence[Any],
+    max_workers: int = MAX_WORKERS,
+) -> list[T]:
+    """
+    Calls `fn` with matching items of `arg_seqs`, like `map`, returning the
+    results in input order.
+
+    The calls are overlapped across a pool of threads, which pays off for
+    I/O that releases the GIL. Short batches are run serially.
+    """
+    if min(map(len, arg_seqs), default=0) < BATCH_THRESHOLD:
+        return [fn(*args) for args in zip(*arg_seqs)]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Consuming the results re-raises any error from the workers.
+        return list(pool.map(fn, *arg_seqs))
+
+
+def _read_bytes(fp: PathLike) -> bytes:
+    return Path(fp).read_bytes()
+
+
+def read_files(fps: Sequence[PathLike]) -> list[bytes]:
+    """Reads the contents of many small files, returned in input order."""
+    return run_batch(_read_bytes, fps)
+
+
+def _write_bytes(fp: PathLike, payload: bytes) -> None:
+    with open(fp, "wb") as f:
+        f.write(payload)
+
+
+def write_files(fps: Sequence[PathLike], payloads: Sequence[bytes]) -> None:
+    """Writes each payload to its matching file path."""
+    run_batch(_write_bytes, fps, payloads)
@@ -0,0 +1,148 @@
+# Standard Libraries
+import re
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+# Dependencies
+import numpy as np
+
+# Relative Imports
+from .custom_types import PathLike, Path
+
+type Interleave = Literal["bsq", "bil", "bip"]
+
+# ENVI "data type" codes for the non-complex types numpy can map directly.
+_ENVI_DTYPES = {
+    1: "u1",
+    2: "i2",
+    3: "i4",
+    4: "f4",
+    5: "f8",
+    12: "u2",
+    13: "u4",
+    14: "i8",
+    15: "u8",
+}
+
+# On-disk array shape and the axes that reorder it to (rows, cols, bands).
+_INTERLEAVE_AXES: dict[Interleave, tuple[int, int, int]] = {
+    "bsq": (1, 2, 0),
+    "bil": (0, 2, 1),
+    "bip": (0, 1, 2),
+}
+
+
+# Formats with their own container, which GDAL may pair with an ENVI .hdr
+# that describes the decoded data rather than the bytes of the file.
+_NON_RAW_SUFFIXES = {".tif", ".tiff", ".jp2", ".nc", ".h5", ".hdf", ".vrt"}
+
+
+@dataclass
+class EnviHeader:
+    """Subset of an ENVI header needed to address the raw raster file."""
+
+    samples: int
+    lines: int
+    bands: int
+    header_offset: int
+    dtype: np.dtype
+    interleave: Interleave
+
+    @property
+    def file_shape(self) -> tuple[int, int, int]:
+        """Shape of the array as it is laid out in the raster file."""
+        if self.interleave == "bsq":
+            return (self.bands, self.lines, self.samples)
+        elif self.interleave == "bil":
+            return (self.lines, self.bands, self.samples)
+        return (self.lines, self.samples, self.bands)
+
+
+def _find_header(raster_fp: PathLike) -> Optional[Path]:
+    """Returns the .hdr file sitting next to `raster_fp`, if there is one."""
+    raster_path = Path(raster_fp)
+    for hdr in (raster_path.with_suffix(".hdr"), Path(f"{raster_path}.hdr")):
+        if hdr.is_file():
+            return hdr
+    return None
+
+
+def _header_int(text: str, key: str) -> Optional[int]:
+    match = re.search(rf"^\s*{key}\s*=\s*(\d+)", text, re.M | re.I)
+    return int(match.group(1)) if match else None
+
+
+def read_header(raster_fp: PathLike) -> Optional[EnviHeader]:
+    """
+    Parses the ENVI header of `raster_fp`.
+
+    Returns None if the raster has no ENVI header, or if the header describes
+    data that can't be addressed as a raw array (compressed or complex data,
+    or a file in another format such as a GeoTIFF with an ENVI sidecar).
+    """
+    if Path(raster_fp).suffix.lower() in _NON_RAW_SUFFIXES:
+        return None
+    hdr = _find_header(raster_fp)
+    if hdr is None:
+        return None
+    text = hdr.read_text(errors="replace")
+    if not text.lstrip().startswith("ENVI"):
+        return None
+    if _header_int(text, "file compression"):
+        return None
+    file_type = re.search(r"^\s*file type\s*=\s*(.*?)\s*$", text, re.M | re.I)
+    if file_type is not None and file_type.group(1).lower() != "envi standard":
+        return None
+
+    samples = _header_int(text, "samples")
+    lines = _header_int(text, "lines")
+    bands = _header_int(text, "bands")
+    data_type = _header_int(text, "data type")
+    interleave = re.search(r"^\s*interleave\s*=\s*(\w+)", text, re.M | re.I)
+    if (
+        samples is None
+        or lines is None
+        or bands is None
+        or data_type not in _ENVI_DTYPES
+        or interleave is None
+        or interleave.group(1).lower() not in _INTERLEAVE_AXES
+    ):
+        return None
+
+    byteorder = "<" if not _header_int(text, "byte order") else ">"
+    return EnviHeader(
+        samples=samples,
+        lines=lines,
+        bands=bands,
+        header_offset=_header_int(text, "header offset") or 0,
+        dtype=np.dtype(byteorder + _ENVI_DTYPES[data_type]),
+        interleave=interleave.group(1).lower(),  # type: ignore
+    )
+
+
+def memmap_raster(raster_fp: PathLike) -> Optional[np.ndarray]:
+    """
+    Memory-maps a raw ENVI raster as a (rows, cols, bands) array.
+
+    The map is copy-on-write: the array can be edited in place, but changes
+    are kept in memory and never written back to the raster file.
+
+    Returns None if the raster can't be mapped directly, in which case it
+    should be read through rasterio instead. This includes rasters stored in
+    non-native byte order, which rasterio returns swapped to native order.
+    """
+    header = read_header(raster_fp)
+    if header is None or not header.dtype.isnative:
+        return None
+    nbytes = header.dtype.itemsize * header.samples * header.lines
+    nbytes *= header.bands
+    if Path(raster_fp).stat().st_size < header.header_offset + nbytes:
+        return None
+    arr = np.memmap(
+        raster_fp,
+        dtype=header.dtype,
+        mode="c",
+        offset=header.header_offset,
+        shape=header.file_shape,
+    )
+    return np.transpose(arr, _INTERLEAVE_AXES[header.interleave])
@@ -0,0 +1,31 @@
+# Standard Libraries
+from pathlib import PurePath
+from typing import Any
+
+# Dependencies
+import numpy as np
+import orjson
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for values orjson can't serialize natively."""
+    if isinstance(obj, PurePath):
+        return str(obj)
+    # Non-contiguous arrays are handed to the fallback by orjson.
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_json(model: BaseModel, *, indent: bool = True) -> bytes:
+    """
+    Serializes a model to JSON bytes using orjson.
+
+    The model is dumped in python mode so that ndarray fields reach orjson
+    as arrays, which it serializes natively without building Python lists.
+    """
+    option = orjson.OPT_SERIALIZE_NUMPY
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(model.model_dump(), default=_default, option=option)
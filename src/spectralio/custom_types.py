@@ -1,7 +1,35 @@
 # Standard Library
-from typing import Literal
+from typing import Annotated, Literal
 from pathlib import Path
 import os
 
+# Dependencies
+import numpy as np
+from pydantic import PlainSerializer, PlainValidator
+
 type WvlUnit = Literal["nm", "um", "m", "v"]
 type PathLike = str | Path | os.PathLike
+
+
+def _as_spectrum_array(value) -> np.ndarray:
+    """Coerces `value` to a 1D float32 array, or raises a ValueError."""
+    try:
+        arr = np.asarray(value, dtype=np.float32)
+    except (TypeError, ValueError):
+        raise ValueError("A spectrum must be a sequence of numbers.") from None
+    if arr.ndim != 1:
+        raise ValueError(
+            f"A spectrum must be 1-dimensional, not {arr.ndim}-dimensional."
+        )
+    return arr
+
+
+# 1D float32 array, stored in memory as an ndarray and serialized as a list.
+# Python-mode dumps keep the ndarray so orjson can serialize it directly.
+type SpectrumArray = Annotated[
+    np.ndarray,
+    PlainValidator(_as_spectrum_array),
+    PlainSerializer(
+        lambda a: a.tolist(), return_type=list[float], when_used="json"
+    ),
+]
@@ -5,6 +5,7 @@ from typing import Literal
 
 # Dependencies
 from pydantic import BaseModel, Field, model_validator
+import numpy as np
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -84,6 +85,38 @@ class GeotransformModel(BaseModel):
             self.col_rotation,
         )
 
+    @property
+    def affine(self) -> np.ndarray:
+        """2x3 matrix mapping a pixel point (x, y, 1) to a map point."""
+        return np.array(
+            [
+                [self.xres, self.row_rotation, self.upperleft.x],
+                [self.col_rotation, self.yres, self.upperleft.y],
+            ]
+        )
+
+    @property
+    def is_rotated(self) -> bool:
+        """True if either rotation term of the geotransform is non-zero."""
+        return self.row_rotation != 0 or self.col_rotation != 0
+
+    @property
+    def is_identity(self) -> bool:
+        """True if map coordinates are the same as pixel coordinates."""
+        return (
+            not self.is_rotated
+            and self.xres == 1
+            and self.yres == 1
+            and self.upperleft.x == 0
+            and self.upperleft.y == 0
+        )
+
+    @property
+    def inverse_affine(self) -> np.ndarray:
+        """2x3 matrix mapping a map point (x, y, 1) to a pixel point."""
+        inv = np.linalg.inv(self.affine[:, :2])
+        return np.hstack([inv, -inv @ self.affine[:, 2:]])
+
     def get_bbox(self, height: int, width: int):
         """Given the height and width of a raster, return a bounding box."""
         return Bounds(
@@ -112,23 +145,33 @@ class GeotransformModel(BaseModel):
                 xmap += 360
         return xmap, ymap
 
+    def pixel_to_map_batch(
+        self,
+        pixel_pts: np.ndarray,
+        convention: Literal["globe", "hemi"] = "hemi",
+    ) -> np.ndarray:
+        """Convert an Nx2 array of pixel points to an array of map points."""
+        pixel_pts = np.asarray(pixel_pts, dtype=np.float64)
+        if self.is_identity:
+            map_pts = pixel_pts.copy()
+        elif not self.is_rotated:
+            map_pts = pixel_pts * (self.xres, self.yres) + self.affine[:, 2]
+        else:
+            map_pts = pixel_pts @ self.affine[:, :2].T + self.affine[:, 2]
+
+        if convention == "globe":
+            xmap = map_pts[:, 0]
+            xmap[xmap < 0] += 360
+        return map_pts
+
     def map_to_pixel(self, xmap: float, ymap: float) -> tuple[float, float]:
         """Convert a map coordinate point to a pixel coordinate point."""
-        _scaler = (self.xres * self.yres) - (
-            self.col_rotation * self.row_rotation
-        )
-        xpixel = (
-            (self.yres * xmap)
-            - (self.upperleft.x * self.yres)
-            - ((self.row_rotation * self.yres) / self.xres) * ymap
-            + (self.row_rotation * self.upperleft.y)
-        ) / _scaler
-        ypixel = (
-            (self.xres * ymap)
-            - (self.upperleft.y * self.xres)
-            - ((self.col_rotation * self.xres) / self.yres) * xmap
-            + (self.col_rotation * self.upperleft.x)
-        ) / _scaler
+        # Closed-form inverse of the 2x2 part of `affine`, in plain floats.
+        det = self.xres * self.yres - self.row_rotation * self.col_rotation
+        dx = xmap - self.upperleft.x
+        dy = ymap - self.upperleft.y
+        xpixel = (self.yres * dx - self.row_rotation * dy) / det
+        ypixel = (self.xres * dy - self.col_rotation * dx) / det
 
         if xpixel < 0:
             raise GeographicBoundsError(
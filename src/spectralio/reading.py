@@ -1,6 +1,10 @@
 # Standard Libraries
 import logging
-from typing import overload, Literal
+from typing import overload, Literal, Sequence
+
+# Dependencies
+import numpy as np
+import orjson
 
 # Relative Imports
 from .wvl_models import WvlModel
@@ -11,24 +15,47 @@ from .spec1D_models import (
     Spec1DFileLiteral,
 )
 from .spec3D_models import Spectrum3D, GeoSpectrum3D, Spec3DFileLiteral
-from .specgroup_models import SpectrumGroup
+from .specgroup_models import (
+    GROUP_BINARY_FORMAT,
+    GROUP_BINARY_VERSION,
+    SpectrumGroup,
+)
 from .geospatial_models import BaseGeolocationModel
+from ._batch_io import read_files
 from ._errors import FileTypeError
 from .custom_types import PathLike, Path
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-
-def read_geodata(geodata_fp: PathLike) -> BaseGeolocationModel:
-    file_suff = Path(geodata_fp).suffix
-    if file_suff != ".geodata":
+# Compiled pydantic-core validators, looked up once at import time.
+_VALIDATE_GEODATA = BaseGeolocationModel.__pydantic_validator__.validate_python
+_VALIDATE_GROUP = SpectrumGroup.__pydantic_validator__.validate_python
+_VALIDATE_WVL = WvlModel.__pydantic_validator__.validate_python
+_SPEC1D_VALIDATORS = {
+    "rawspec": Spectrum1D.__pydantic_validator__.validate_python,
+    "pntspec": PointSpectrum1D.__pydantic_validator__.validate_python,
+    "geospec": GeoSpectrum1D.__pydantic_validator__.validate_python,
+}
+_SPEC3D_VALIDATORS = {
+    "spcub": Spectrum3D.__pydantic_validator__.validate_python,
+    "geospcub": GeoSpectrum3D.__pydantic_validator__.validate_python,
+}
+
+
+def _check_suffix(fp: PathLike, suffix: str) -> None:
+    """Raises a FileTypeError if `fp` does not end in `suffix`."""
+    file_suff = Path(fp).suffix
+    if file_suff != suffix:
         raise FileTypeError(
-            f"The file type should be .geodata not {file_suff}."
+            f"The file type should be {suffix} not {file_suff}."
         )
-    with open(geodata_fp, "r") as f:
-        json_str = f.read()
-    return BaseGeolocationModel.model_validate_json(json_str)
+
+
+def read_geodata(geodata_fp: PathLike) -> BaseGeolocationModel:
+    _check_suffix(geodata_fp, ".geodata")
+    data = orjson.loads(Path(geodata_fp).read_bytes())
+    return _VALIDATE_GEODATA(data)
 
 
 @overload
@@ -50,33 +77,81 @@ def read_spec1D(
 
 
 def read_spec1D(spec1d_fp: PathLike, kind: Spec1DFileLiteral):
-    if kind == "rawspec":
-        with open(spec1d_fp, "r") as f:
-            json_str = f.read()
-        spec_model = Spectrum1D.model_validate_json(json_str)
-        return spec_model
-    elif kind == "pntspec":
-        with open(spec1d_fp, "r") as f:
-            json_str = f.read()
-        spec_model = PointSpectrum1D.model_validate_json(json_str)
-        return spec_model
-    elif kind == "geospec":
-        with open(spec1d_fp, "r") as f:
-            json_str = f.read()
-        spec_model = GeoSpectrum1D.model_validate_json(json_str)
-        return spec_model
+    if kind not in _SPEC1D_VALIDATORS:
+        raise FileTypeError(f"{kind} is not a 1D spectrum file type.")
+    data = orjson.loads(Path(spec1d_fp).read_bytes())
+    return _SPEC1D_VALIDATORS[kind](data)
+
+
+def _load_group(data: dict, specgroup_fp: PathLike) -> SpectrumGroup:
+    """
+    Validates parsed .specgrp data, first loading the spectra from the
+    sibling .npz file if `data` is a binary group descriptor.
+    """
+    if data.get("format") != GROUP_BINARY_FORMAT:
+        return _VALIDATE_GROUP(data)
+    if data["format_version"] > GROUP_BINARY_VERSION:
+        raise FileTypeError(
+            f"{specgroup_fp} uses binary group format version "
+            f"{data['format_version']}, which is newer than the supported "
+            f"version ({GROUP_BINARY_VERSION})."
+        )
+
+    data_fp = Path(specgroup_fp).with_name(data["data_file"])
+    with np.load(data_fp) as npz:
+        spectra = npz["spectra"]
+        locations = npz["locations"]
+
+    name = data["name"]
+    pts = locations.tolist()
+    return _VALIDATE_GROUP(
+        {
+            "name": name,
+            "spectra": [
+                {
+                    "name": f"{name}_{n:04d}",
+                    "spectrum": spec,
+                    "bbl_applied": False,
+                    "pixel": {"x": px, "y": py},
+                }
+                for n, (spec, (px, py)) in enumerate(zip(spectra, pts))
+            ],
+            "spectra_pts": pts,
+            "wavelength": data["wavelength"],
+            "polygon_vertices": data["polygon_vertices"],
+            "bbl_applied": data["bbl_applied"],
+        }
+    )
 
 
 def read_group(specgroup_fp: PathLike):
-    file_suff = Path(specgroup_fp).suffix
-    if file_suff != ".specgrp":
-        raise FileTypeError(f"The file type should be .wvl not {file_suff}.")
-    with open(specgroup_fp, "r") as f:
-        json_str = f.read()
-    group_model = SpectrumGroup.model_validate_json(json_str)
+    _check_suffix(specgroup_fp, ".specgrp")
+    data = orjson.loads(Path(specgroup_fp).read_bytes())
+    group_model = _load_group(data, specgroup_fp)
     return group_model
 
 
+def read_group_batch(specgroup_fps: Sequence[PathLike]) -> list[SpectrumGroup]:
+    """
+    Read many .specgrp files into SpectrumGroup objects.
+
+    Parameters
+    ----------
+    specgroup_fps: Sequence of PathLike
+        File paths to .specgrp files.
+
+    Returns
+    -------
+    List of SpectrumGroup objects, in the same order as `specgroup_fps`.
+    """
+    for fp in specgroup_fps:
+        _check_suffix(fp, ".specgrp")
+    return [
+        _load_group(orjson.loads(buf), fp)
+        for fp, buf in zip(specgroup_fps, read_files(specgroup_fps))
+    ]
+
+
 @overload
 def read_spec3D(spec3d_fp: PathLike, kind: Literal["spcub"]) -> Spectrum3D: ...
 
@@ -88,16 +163,10 @@ def read_spec3D(
 
 
 def read_spec3D(spec3d_fp: PathLike, kind: Spec3DFileLiteral):
-    if kind == "spcub":
-        with open(spec3d_fp, "r") as f:
-            json_str = f.read()
-        spec_model = Spectrum3D.model_validate_json(json_str)
-        return spec_model
-    if kind == "geospcub":
-        with open(spec3d_fp, "r") as f:
-            json_str = f.read()
-        spec_model = GeoSpectrum3D.model_validate_json(json_str)
-        return spec_model
+    if kind not in _SPEC3D_VALIDATORS:
+        raise FileTypeError(f"{kind} is not a 3D spectrum file type.")
+    data = orjson.loads(Path(spec3d_fp).read_bytes())
+    return _SPEC3D_VALIDATORS[kind](data)
 
 
 def read_wvl(wvl_fp: PathLike) -> WvlModel:
@@ -112,10 +181,7 @@ def read_wvl(wvl_fp: PathLike) -> WvlModel:
     -------
     WvlModel object.
     """
-    file_suff = Path(wvl_fp).suffix
-    if file_suff != ".wvl":
-        raise FileTypeError(f"The file type should be .wvl not {file_suff}.")
-    with open(wvl_fp, "r") as f:
-        json_str = f.read()
-    wvl_model = WvlModel.model_validate_json(json_str)
+    _check_suffix(wvl_fp, ".wvl")
+    data = orjson.loads(Path(wvl_fp).read_bytes())
+    wvl_model = _VALIDATE_WVL(data)
     return wvl_model
@@ -1,14 +1,63 @@
+# Standard Libraries
+import os
+from typing import Any
+
 # Dependencies
-from shapely.geometry import mapping
+import numpy as np
+from shapely.geometry import Polygon, mapping
 import fiona  # type: ignore
 
 # Relative Imports
+from ._batch_io import run_batch
 from .custom_types import Path, PathLike
 from .spec1D_models import GeoSpectrum1D
 from .specgroup_models import SpectrumGroup
+from .geospatial_models import BaseGeolocationModel
 from .reading import read_geodata
 
 
+# Fiona releases the GIL inside GDAL, so per-file writes overlap in threads.
+_MAX_WRITERS = min(8, os.cpu_count() or 1)
+
+
+def _write_shapefile(
+    save_file: Path, fiona_config: dict[str, Any], record: dict[str, Any]
+) -> None:
+    with fiona.open(save_file, "w", **fiona_config) as c:
+        c.write(record)
+
+
+def _write_shapefiles(
+    save_files: list[Path],
+    fiona_configs: list[dict[str, Any]],
+    records: list[dict[str, Any]],
+) -> None:
+    """Writes one single-record shapefile per entry."""
+    # As with sequential writes, the last entry for a repeated path wins.
+    jobs = dict(zip(save_files, zip(fiona_configs, records)))
+    run_batch(
+        _write_shapefile,
+        list(jobs.keys()),
+        [job[0] for job in jobs.values()],
+        [job[1] for job in jobs.values()],
+        max_workers=_MAX_WRITERS,
+    )
+
+
+def _map_polygons(
+    spectra: list[SpectrumGroup], geodata: BaseGeolocationModel
+) -> list[Polygon]:
+    """Transforms the polygons of all groups to map coordinates at once."""
+    if len(spectra) == 0:
+        return []
+    vert_arrs = [spec.get_vertices_arr() for spec in spectra]
+    map_verts = geodata.geotransform.pixel_to_map_batch(
+        np.concatenate(vert_arrs)
+    )
+    splits = np.cumsum([len(i) for i in vert_arrs])[:-1]
+    return [Polygon(i) for i in np.split(map_verts, splits)]
+
+
 def make_points(spectra: list[GeoSpectrum1D], output_path: PathLike):
     schema = {
         "geometry": "Point",
@@ -16,16 +65,20 @@ def make_points(spectra: list[GeoSpectrum1D], output_path: PathLike):
     }
     fiona_config = {"crs": None, "driver": "ESRI Shapefile", "schema": schema}
     if Path(output_path).is_dir():
-        for spec in spectra:
-            fiona_config["crs"] = spec.point.crs
-            save_file = Path(output_path, spec.name).with_suffix(".shp")
-            with fiona.open(save_file, "w", **fiona_config) as c:
-                c.write(
-                    {
-                        "geometry": mapping(spec.shapely_geometry()),
-                        "properties": {"name": spec.name, "id": 1},
-                    }
-                )
+        _write_shapefiles(
+            [
+                Path(output_path, spec.name).with_suffix(".shp")
+                for spec in spectra
+            ],
+            [{**fiona_config, "crs": spec.point.crs} for spec in spectra],
+            [
+                {
+                    "geometry": mapping(spec.shapely_geometry()),
+                    "properties": {"name": spec.name, "id": 1},
+                }
+                for spec in spectra
+            ],
+        )
     elif Path(output_path):
         save_file = Path(output_path).with_suffix(".shp")
         fiona_config["crs"] = spectra[0].point.crs
@@ -52,27 +105,33 @@ def make_polygons(
         "driver": "ESRI Shapefile",
         "schema": schema,
     }
+    polygons = _map_polygons(spectra, geodata)
     if Path(output_path).is_dir():
-        for spec in spectra:
-            save_file = Path(output_path, spec.name).with_suffix(".shp")
-            with fiona.open(save_file, "w", **fiona_config) as c:
-                c.write(
-                    {
-                        "geometry": mapping(spec.shapely_geometry(geodata)),
-                        "properties": {
-                            "name": spec.name,
-                            "id": 1,
-                            "nspectra": spec.nspectra,
-                        },
-                    }
-                )
+        _write_shapefiles(
+            [
+                Path(output_path, spec.name).with_suffix(".shp")
+                for spec in spectra
+            ],
+            [fiona_config] * len(spectra),
+            [
+                {
+                    "geometry": mapping(poly),
+                    "properties": {
+                        "name": spec.name,
+                        "id": 1,
+                        "nspectra": spec.nspectra,
+                    },
+                }
+                for spec, poly in zip(spectra, polygons)
+            ],
+        )
     elif Path(output_path):
         save_file = Path(output_path).with_suffix(".shp")
         with fiona.open(save_file, "w", **fiona_config) as c:
-            for n, spec in enumerate(spectra):
+            for n, (spec, poly) in enumerate(zip(spectra, polygons)):
                 c.write(
                     {
-                        "geometry": mapping(spec.shapely_geometry(geodata)),
+                        "geometry": mapping(poly),
                         "properties": {
                             "name": spec.name,
                             "id": n,
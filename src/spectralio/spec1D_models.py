@@ -3,11 +3,12 @@ from enum import StrEnum
 from typing import Literal
 
 # Dependencies
-from pydantic import BaseModel, Field
 import numpy as np
+from pydantic import BaseModel, Field
 from shapely.geometry import Point
 
 # Relative Imports
+from .custom_types import SpectrumArray
 from .geospatial_models import PointGeolocation, PointModel
 from .wvl_models import WvlModel
 
@@ -30,7 +31,7 @@ class Spectrum1D(BaseModel):
     ----------
     name: str
         Name of the spectrum.
-    spectrum: list[float]
+    spectrum: np.ndarray
         Data of the spectrum (e.g. Reflectance, Emissivity, Transmittance)
     wavelength: WvlModel
         Wavelength Object corresponding to the spectrum.
@@ -41,12 +42,23 @@ class Spectrum1D(BaseModel):
     """
 
     name: str
-    spectrum: list[float]
+    spectrum: SpectrumArray
     wavelength: WvlModel
     bbl_applied: bool = Field(default=False)
 
+    def __eq__(self, other: object) -> bool:
+        # The default comparison can't reduce the spectrum array to a bool.
+        if type(other) is not type(self):
+            return NotImplemented
+        fields, other_fields = self.__dict__, other.__dict__
+        return np.array_equal(
+            fields["spectrum"], other_fields["spectrum"]
+        ) and all(
+            fields[k] == other_fields[k] for k in fields if k != "spectrum"
+        )
+
     def applybbl(self):
-        self.spectrum = list(np.asarray(self.spectrum)[self.wavelength.bbl])
+        self.spectrum = self.spectrum[self.wavelength.good_band_idx]
         self.bbl_applied = True
 
 
@@ -59,7 +71,7 @@ class PointSpectrum1D(Spectrum1D):
     ----------
     name: str
         Name of the spectrum.
-    spectrum: list[float]
+    spectrum: np.ndarray
         Data of the spectrum (e.g. Reflectance, Emissivity, Transmittance)
     wavelength: WvlModel
         Wavelength Object corresponding to the spectrum.
@@ -84,7 +96,7 @@ class GeoSpectrum1D(Spectrum1D):
     ----------
     name: str
         Name of the spectrum.
-    spectrum: list[float]
+    spectrum: np.ndarray
         Data of the spectrum (e.g. Reflectance, Emissivity, Transmittance)
     wavelength: WvlModel
         Wavelength Object corresponding to the spectrum.
@@ -8,6 +8,7 @@ from rasterio.windows import Window  # type: ignore
 import numpy as np
 
 # Relative Imports
+from ._envi import memmap_raster
 from .custom_types import PathLike
 from .geospatial_models import BaseGeolocationModel
 from .wvl_models import WvlModel
@@ -33,6 +34,7 @@ class Spectrum3D(BaseModel):
         self,
         pixel_window: Optional[tuple[int, int, int, int]] = None,
         bbl: bool = True,
+        use_memmap: bool = True,
     ) -> np.ndarray:
         """
         Load raster data from absolute file path stored in the file.
@@ -43,23 +45,40 @@ class Spectrum3D(BaseModel):
             A window tuple, (col_offset, row_offset, width, height). Default
             is None. Provide this argument to read a partial amount of the
             larger array.
+        bbl: bool, optional
+            If true (default), removes the bad bands specified in the
+            wavelength model.
+        use_memmap: bool, optional
+            If true (default), raw ENVI rasters are memory-mapped rather than
+            read into memory, so only the pixels that are accessed are paged
+            in from disk. In-place edits of a mapped array are not written
+            back to the file. Other raster formats, and ENVI rasters in
+            non-native byte order, are always read with rasterio.
 
         Returns
         -------
         np.ndarray
             Loaded array.
         """
-        if pixel_window is not None:
-            w = Window(*pixel_window)  # type: ignore
-            with rio.open(self.raster_fp, "r") as f:
-                arr = f.read(window=w)
+        arr = memmap_raster(self.raster_fp) if use_memmap else None
+        if arr is not None:
+            if pixel_window is not None:
+                col_off, row_off, width, height = pixel_window
+                arr = arr[
+                    row_off : row_off + height, col_off : col_off + width
+                ]
         else:
-            with rio.open(self.raster_fp, "r") as f:
-                arr = f.read()
+            if pixel_window is not None:
+                w = Window(*pixel_window)  # type: ignore
+                with rio.open(self.raster_fp, "r") as f:
+                    arr = f.read(window=w)
+            else:
+                with rio.open(self.raster_fp, "r") as f:
+                    arr = f.read()
+            arr = np.transpose(arr, (1, 2, 0))
 
-        arr = np.transpose(arr, (1, 2, 0))
         if bbl:
-            arr = arr[:, :, self.wavelength.bbl]
+            arr = arr[:, :, self.wavelength.good_band_idx]
         return arr
 
 
@@ -1,11 +1,15 @@
+# Standard Libraries
+from typing import Any
+
 # Dependencies
 from dataclasses import dataclass, field
 from pydantic import BaseModel, Field, model_validator
 import numpy as np
 from shapely.geometry import Polygon
-from alphashape import alphashape  # type: ignore
 
 # Relative Imports
+from ._batch_io import write_files
+from ._serialization import dump_json
 from .custom_types import PathLike, Path
 from .spec1D_models import PointSpectrum1D, Spec1DFileTypes
 from .geospatial_models import BaseGeolocationModel
@@ -13,6 +17,11 @@ from .wvl_models import WvlModel
 
 # from .geospatial_models import Bounds
 
+# Binary .specgrp files are a JSON descriptor holding these keys plus a
+# sibling .npz archive with the spectra and their locations.
+GROUP_BINARY_FORMAT = "npz"
+GROUP_BINARY_VERSION = 1
+
 
 @dataclass
 class GroupStats:
@@ -25,6 +34,27 @@ class GroupStats:
         self.error_bounds = (self.mean - self.stdev, self.mean + self.stdev)
 
 
+def outline_vertices(
+    spectra_pts: list[tuple[int, int]],
+) -> list[tuple[float, float]]:
+    """Vertices of the concave hull (alpha shape) around a set of points."""
+    # alphashape pulls in scipy and trimesh, so it is only imported when an
+    # outline actually has to be computed.
+    from alphashape import alphashape  # type: ignore
+
+    poly: Polygon = alphashape(spectra_pts, alpha=0.9)  # type: ignore
+    return list(map(tuple, np.column_stack(poly.exterior.xy).tolist()))
+
+
+def _column_median(arr: np.ndarray) -> np.ndarray:
+    """Median of each column of `arr`, found by partitioning around it."""
+    half = arr.shape[0] // 2
+    if arr.shape[0] % 2:
+        return np.partition(arr, half, axis=0)[half]
+    part = np.partition(arr, (half - 1, half), axis=0)
+    return (part[half - 1] + part[half]) / 2
+
+
 class SpectrumGroup(BaseModel):
     name: str
     spectra: list[PointSpectrum1D]
@@ -34,13 +64,34 @@ class SpectrumGroup(BaseModel):
     nspectra: int = Field(default=0)
     bbl_applied: bool = Field(default=False)
 
+    @model_validator(mode="before")
+    @classmethod
+    def share_wavelength(cls, data: Any) -> Any:
+        """
+        Gives every spectrum stored without a wavelength the group's
+        wavelength, validating it once rather than once per spectrum.
+        """
+        if not isinstance(data, dict) or "wavelength" not in data:
+            return data
+        wvl = data["wavelength"]
+        if not isinstance(wvl, WvlModel):
+            wvl = WvlModel.model_validate(wvl)
+        spectra = [
+            (
+                {**i, "wavelength": wvl}
+                if isinstance(i, dict) and "wavelength" not in i
+                else i
+            )
+            for i in data.get("spectra", [])
+        ]
+        return {**data, "wavelength": wvl, "spectra": spectra}
+
     @model_validator(mode="after")
     def set_nspectra(self) -> "SpectrumGroup":
         self.nspectra = len(self.spectra)
-        poly: Polygon = alphashape(self.spectra_pts, alpha=0.9)  # type: ignore
-        self.polygon_vertices = [
-            (i, j) for i, j in zip(poly.exterior.xy[0], poly.exterior.xy[1])
-        ]
+        # Groups loaded from disk already carry their outline.
+        if len(self.polygon_vertices) == 0:
+            self.polygon_vertices = outline_vertices(self.spectra_pts)
         return self
 
     def applybbl(self):
@@ -49,56 +100,49 @@ class SpectrumGroup(BaseModel):
         self.bbl_applied = True
 
     def asarray(self) -> np.ndarray:
-        if self.bbl_applied:
-            _nbands = self.spectra[0].wavelength.ngoodbands
-        else:
-            _nbands = self.spectra[0].wavelength.nbands
-        group_array = np.empty((self.nspectra, _nbands), dtype=np.float32)
-        for n, i in enumerate(self.spectra):
-            group_array[n, :] = i.spectrum
-        return group_array
+        return np.stack([i.spectrum for i in self.spectra])
 
     def export_to_directory(self, out_dir: PathLike) -> None:
-        for i in self.spectra:
-            json_str = i.model_dump_json(indent=2)
-            with open(
+        write_files(
+            [
                 Path(out_dir, i.name).with_suffix(Spec1DFileTypes.PNT)
-            ) as f:
-                f.write(json_str)
+                for i in self.spectra
+            ],
+            [dump_json(i) for i in self.spectra],
+        )
 
     def create_mask(self, height: int, width: int) -> np.ndarray:
         mask_arr = np.zeros((height, width), dtype=np.bool)
-        x_pts: list[int] = []
-        y_pts: list[int] = []
-        for spec in self.spectra:
-            x_pts.append(int(spec.pixel.x))
-            y_pts.append(int(spec.pixel.y))
-        x_pts_arr = np.asarray(x_pts)
-        y_pts_arr = np.asarray(y_pts)
-
-        mask_arr[x_pts_arr, y_pts_arr] = True
+        pts = np.fromiter(
+            (spec.pixel.astuple() for spec in self.spectra),
+            dtype=np.dtype((np.float64, 2)),
+            count=self.nspectra,
+        ).astype(np.intp)
+        mask_arr[pts[:, 1], pts[:, 0]] = True
 
         return mask_arr
 
     def get_stats(self) -> GroupStats:
         arr = self.asarray()
+        mean = np.mean(arr, axis=0)
+        median = _column_median(arr)
+        # Match np.median, which returns NaN for any column containing NaN.
+        median[np.isnan(mean)] = np.nan
 
         return GroupStats(
-            mean=np.mean(arr, axis=0),
-            median=np.median(arr, axis=0),
+            mean=mean,
+            median=median,
             stdev=np.std(arr, axis=0, ddof=1),
         )
 
     def get_vertices_arr(self) -> np.ndarray:
-        vert_arr = np.empty((len(self.polygon_vertices), 2))
-
-        for n, i in enumerate(self.polygon_vertices):
-            vert_arr[n, :] = i
-
-        return vert_arr
+        return np.asarray(self.polygon_vertices, dtype=np.float64).reshape(
+            -1, 2
+        )
 
     def shapely_geometry(self, geodata: BaseGeolocationModel) -> Polygon:
-        new_verts: list[tuple[float, float]] = []
-        for vert in self.polygon_vertices:
-            new_verts.append(geodata.geotransform.pixel_to_map(*vert))
-        return Polygon(new_verts)
+        if geodata.geotransform.is_identity:
+            return Polygon(self.polygon_vertices)
+        return Polygon(
+            geodata.geotransform.pixel_to_map_batch(self.get_vertices_arr())
+        )
@@ -1,13 +1,19 @@
 # Standard Libraries
 import logging
-from typing import Optional, Literal
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import BinaryIO, Iterator, Optional, Literal
 
 # Dependencies
 import numpy as np
+import orjson
 import rasterio as rio  # type: ignore
 
 # Relative Imports
-from .custom_types import PathLike, Path, WvlUnit
+from ._envi import read_header as read_envi_header
+from ._serialization import dump_json
+from .custom_types import PathLike, Path, WvlUnit, _as_spectrum_array
 from .wvl_models import WvlModel
 from .spec1D_models import (
     Spectrum1D,
@@ -15,7 +21,11 @@ from .spec1D_models import (
     PointSpectrum1D,
     Spec1DFileTypes,
 )
-from .specgroup_models import SpectrumGroup
+from .specgroup_models import (
+    GROUP_BINARY_FORMAT,
+    GROUP_BINARY_VERSION,
+    outline_vertices,
+)
 from .spec3D_models import Spectrum3D, GeoSpectrum3D
 from .geospatial_models import (
     PointModel,
@@ -27,25 +37,104 @@ from .geospatial_models import (
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# write_group stores groups of at least this many spectra in binary form by
+# default.
+BINARY_GROUP_THRESHOLD = 100
+
+
+@lru_cache(maxsize=32)
+def _load_wvlmodel(wvl_path: str, mtime_ns: int, size: int) -> WvlModel:
+    """
+    Parses a wavelength file, cached on its path, modification time and size.
+    """
+    logger.debug("Reading wavelength file: %s", wvl_path)
+    return WvlModel.model_validate(orjson.loads(Path(wvl_path).read_bytes()))
+
 
 def resolve_wvlmodel(wvl: WvlModel | PathLike):
-    """Returns a WvlModel from an input that is either a WvlModel or a Path."""
+    """
+    Returns a WvlModel from an input that is either a WvlModel or a Path.
+
+    Models read from a path are cached until the file changes, so the same
+    instance is returned for repeated calls and should not be modified.
+    """
     # Creating Wavelength Model
     if isinstance(wvl, WvlModel):
         logger.debug("WvlModel object was provided.")
         wvlmodel = wvl
     else:
-        if not Path(wvl).exists():  # Ensuring wvl file existence.
+        try:  # Ensuring wvl file existence.
+            stat = os.stat(wvl)
+        except FileNotFoundError:
             logger.error("Wavelength file not found: %s", wvl)
-            raise FileNotFoundError(f"{wvl} does not exist.")
-        logger.debug("Reading wavelength file: %s", wvl)
-        with open(wvl, "r") as f:
-            json_str = f.read()
-        wvlmodel = WvlModel.model_validate_json(json_str)
+            raise FileNotFoundError(f"{wvl} does not exist.") from None
+        wvlmodel = _load_wvlmodel(
+            str(Path(wvl).resolve()), stat.st_mtime_ns, stat.st_size
+        )
 
     return wvlmodel
 
 
+def _resolve_save_path(fp: PathLike, name: str, suffix: str) -> Path:
+    """
+    Returns the path to write a file to: a file called `name` inside `fp` if
+    `fp` is a directory, otherwise `fp` itself, with `suffix` applied.
+    """
+    save_dir = Path(fp)
+    if save_dir.is_dir():
+        return Path(save_dir, name).with_suffix(suffix)
+    return save_dir.with_suffix(suffix)
+
+
+@contextmanager
+def _replace_on_success(
+    save_path: Path, buffering: int = -1
+) -> Iterator[BinaryIO]:
+    """
+    Opens a temporary file next to `save_path` for writing, which is moved
+    onto `save_path` only once the block completes. If the block raises, the
+    temporary file is removed and any existing file is left untouched.
+    """
+    tmp_path = save_path.with_name(f".{save_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb", buffering=buffering) as f:
+            yield f
+        os.replace(tmp_path, save_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=32)
+def _read_raster_shape(
+    raster_path: str, mtime_ns: int, size: int
+) -> tuple[int, int, int]:
+    """
+    Returns the (height, width, count) of a raster, cached on its path,
+    modification time and size. ENVI headers are parsed directly, skipping
+    the cost of opening a GDAL dataset.
+    """
+    header = read_envi_header(raster_path)
+    if header is not None:
+        return header.lines, header.samples, header.bands
+    with rio.open(raster_path, "r") as f:
+        return f.height, f.width, f.count
+
+
+def _raster_shape(raster_fp: PathLike) -> tuple[int, int, int]:
+    """Returns the (height, width, count) of a raster."""
+    try:
+        stat = os.stat(raster_fp)
+    except OSError:
+        # Paths that GDAL understands but the filesystem doesn't, such as
+        # /vsizip/ paths or s3:// URIs, are opened directly and not cached.
+        with rio.open(raster_fp, "r") as f:
+            return f.height, f.width, f.count
+    return _read_raster_shape(
+        str(Path(raster_fp).resolve()), stat.st_mtime_ns, stat.st_size
+    )
+
+
 def write_geodata(
     crs: str,
     geotransform: tuple[float, float, float, float, float, float],
@@ -54,10 +143,10 @@ def write_geodata(
     gtrans = GeotransformModel.fromgdal(geotransform)
     logger.debug("Creating geotransform model for crs=%s", crs)
     geodatamodel = BaseGeolocationModel(crs=crs, geotransform=gtrans)
-    json_str = geodatamodel.model_dump_json(indent=2)
+    payload = dump_json(geodatamodel)
     out_path = Path(fp).with_suffix(".geodata")
-    with open(out_path, "w") as f:
-        f.write(json_str)
+    with open(out_path, "wb") as f:
+        f.write(payload)
     logger.info("Wrote geodata file: %s", out_path)
 
 
@@ -107,10 +196,6 @@ def write_spec1D(
     - If `geodata_fp` is provided, a .geospec file will be created. This file
     records the pixel value and the map coordinate of the spectrum.
     """
-    # Ensuring spec_vals is a list of floats for compatibility.
-    if isinstance(spec_vals, np.ndarray):
-        spec_vals = list(spec_vals)
-
     logger.debug(
         "write_spec1D called: name=%s fp=%s location=%s location_type=%s"
         "geodata_fp=%s",
@@ -131,15 +216,19 @@ def write_spec1D(
 
         logger.debug("Reading geodata file: %s", geodata_fp)
         # Creating geolocation model
-        with open(geodata_fp, "r") as f:
-            json_str = f.read()
-        geodata = BaseGeolocationModel.model_validate_json(json_str)
+        geodata = BaseGeolocationModel.model_validate(
+            orjson.loads(Path(geodata_fp).read_bytes())
+        )
     else:
         geodata = None
 
+    # Every field of the spectrum model is validated or coerced here, so the
+    # models below are built with model_construct and skip re-validation.
+    spectrum = _as_spectrum_array(spec_vals)
+
     if location is None:
-        specmodel = Spectrum1D(
-            name=name, spectrum=spec_vals, wavelength=wvlmodel
+        specmodel = Spectrum1D.model_construct(
+            name=name, spectrum=spectrum, wavelength=wvlmodel
         )
         file_suffix = Spec1DFileTypes.RAW
     else:
@@ -154,8 +243,8 @@ def write_spec1D(
                     geodata, location, location_type
                 )
 
-            specmodel = GeoSpectrum1D(
-                name=name, spectrum=spec_vals, wavelength=wvlmodel, point=geopt
+            specmodel = GeoSpectrum1D.model_construct(
+                name=name, spectrum=spectrum, wavelength=wvlmodel, point=geopt
             )
             file_suffix = Spec1DFileTypes.GEO
         else:
@@ -164,78 +253,187 @@ def write_spec1D(
                     "If the location is in map coordinates, a file path to a "
                     ".geodata file must be provided."
                 )
-            specmodel = PointSpectrum1D(
+            specmodel = PointSpectrum1D.model_construct(
                 name=name,
-                spectrum=spec_vals,
+                spectrum=spectrum,
                 wavelength=wvlmodel,
                 pixel=PointModel(x=location[0], y=location[1]),
             )
             file_suffix = Spec1DFileTypes.PNT
 
-    if Path(fp).is_dir():
-        save_path = Path(fp, f"{name}").with_suffix(file_suffix)
-    else:
-        save_path = Path(fp).with_suffix(file_suffix)
-
-    final_json_str = specmodel.model_dump_json(indent=2)
-    with open(save_path, "w") as f:
-        f.write(final_json_str)
+    save_path = _resolve_save_path(fp, name, file_suffix)
+    payload = dump_json(specmodel)
+    with open(save_path, "wb") as f:
+        f.write(payload)
     logger.info("Wrote spec1D file: %s", save_path)
 
     return None
 
 
+def _as_locations(spec_locations: list[tuple[int, int]]) -> np.ndarray:
+    """
+    Returns spectrum locations as an Nx2 integer array, raising a ValueError
+    unless every location is a pair of whole numbers.
+    """
+    try:
+        locations = np.asarray(spec_locations, dtype=np.float64)
+    except (TypeError, ValueError):
+        locations = None
+    if (
+        locations is None
+        or locations.ndim != 2
+        or locations.shape[1] != 2
+        or not np.array_equal(locations, np.round(locations))
+    ):
+        raise ValueError(
+            "Spectrum locations should be (x, y) pairs of integer pixel "
+            "coordinates."
+        )
+    return locations.astype(np.int64)
+
+
+def _write_group_binary(
+    spectra: np.ndarray,
+    locations: np.ndarray,
+    wvlmodel: WvlModel,
+    name: str,
+    save_path: Path,
+) -> None:
+    """
+    Writes a group as a JSON descriptor at `save_path` plus a sibling .npz
+    archive holding the spectra (NxB float32) and locations (Nx2 int32).
+    `spectra` and `locations` are expected to be validated by write_group.
+    """
+    data_path = save_path.with_name(f"{save_path.name}.npz")
+    pts = locations.tolist()
+    locations = locations.astype(np.int32)
+    # The descriptor is built before anything is written, so a failure (for
+    # example in alphashape) can't leave a sidecar paired with an old
+    # descriptor.
+    descriptor = orjson.dumps(
+        {
+            "format": GROUP_BINARY_FORMAT,
+            "format_version": GROUP_BINARY_VERSION,
+            "name": name,
+            "data_file": data_path.name,
+            "dtype": spectra.dtype.name,
+            "shape": spectra.shape,
+            "wavelength": wvlmodel.model_dump(),
+            "polygon_vertices": outline_vertices(pts),
+            "nspectra": len(spectra),
+            "bbl_applied": False,
+        }
+    )
+
+    with _replace_on_success(data_path) as f:
+        np.savez(f, spectra=spectra, locations=locations)
+    with _replace_on_success(save_path) as f:
+        f.write(descriptor)
+    logger.debug(f"Wrote SpectrumGroup to {save_path} and {data_path}.")
+
+
 def write_group(
     spec_group: np.ndarray | list[list[float]],
     spec_locations: list[tuple[int, int]],
     wvl: PathLike | WvlModel,
     name: str,
     fp: PathLike,
+    *,
+    encoding: Literal["auto", "binary", "json"] = "auto",
 ) -> None:
+    """
+    Writes a group of spectra to a .specgrp file.
+
+    Parameters
+    ----------
+    spec_group: ArrayLike
+        NxB array of spectra, where B is the number of bands.
+    spec_locations: list of 2-tuple of int
+        Pixel location of each spectrum.
+    wvl: PathLike or WvlModel
+        Either a wavelength model object or a path to a .wvl file.
+    name: str
+        Name of the spectrum group.
+    fp: PathLike
+        File path to save the group to. File extension not included.
+    encoding: str, optional
+        Either "json", "binary" or "auto" (default). "json" writes the whole
+        group as a single JSON document. "binary" writes a small JSON
+        descriptor alongside a <name>.specgrp.npz file holding the spectra
+        and their locations. "auto" uses "binary" for groups of at least
+        `BINARY_GROUP_THRESHOLD` spectra.
+    """
 
     wvlmodel = resolve_wvlmodel(wvl)
 
-    spectra: list[PointSpectrum1D] = []
-    if isinstance(spec_group, np.ndarray):
-        # Checking size of spec_group array
-        spec_data: list[list[float]] = []
-        if spec_group.shape[1] != wvlmodel.nbands:
-            raise ValueError(
-                "The size of a spec_group array should be NxB where B is "
-                f"the number of bands ({wvlmodel.nbands}). It is"
-                f"currently {spec_group.shape}."
-            )
-        for n in range(spec_group.shape[0]):
-            spec_data.append(list(spec_group[n, :]))
-    else:
-        spec_data = spec_group
+    # Rows of a C-contiguous float32 array are serialized by orjson
+    # directly, without building lists of Python floats.
+    try:
+        spec_data = np.ascontiguousarray(spec_group, dtype=np.float32)
+    except (TypeError, ValueError):
+        raise ValueError(
+            "spec_group should be an NxB array of numbers."
+        ) from None
+    # Checking size of spec_group array
+    if spec_data.ndim != 2 or spec_data.shape[1] != wvlmodel.nbands:
+        raise ValueError(
+            "The size of a spec_group array should be NxB where B is "
+            f"the number of bands ({wvlmodel.nbands}). It is "
+            f"currently {spec_data.shape}."
+        )
+    locations = _as_locations(spec_locations)
 
-    for n, spec in enumerate(spec_data):
-        spectra.append(
-            PointSpectrum1D(
-                name=f"{name}_{n:04d}",
-                spectrum=spec,
-                wavelength=wvlmodel,
-                pixel=PointModel(
-                    x=spec_locations[n][0], y=spec_locations[n][1]
-                ),
-            )
+    if len(spec_data) != len(locations):
+        raise ValueError(
+            f"The number of spectra ({len(spec_data)}) does not match the "
+            f"number of spectrum locations ({len(locations)})."
         )
+    pts = locations.tolist()
 
-    grp_obj = SpectrumGroup(
-        name=name,
-        spectra=spectra,
-        spectra_pts=spec_locations,
-        wavelength=wvlmodel,
-    )
-    json_str = grp_obj.model_dump_json(indent=2)
+    save_path = _resolve_save_path(fp, name, ".specgrp")
 
-    if Path(fp).is_dir():
-        save_path = Path(fp, name).with_suffix(".specgrp")
-    else:
-        save_path = Path(fp).with_suffix(".specgrp")
-    with open(save_path, "w") as f:
-        f.write(json_str)
+    if encoding == "auto":
+        if len(spec_data) >= BINARY_GROUP_THRESHOLD:
+            encoding = "binary"
+        else:
+            encoding = "json"
+    if encoding == "binary":
+        _write_group_binary(spec_data, locations, wvlmodel, name, save_path)
+        return None
+    elif encoding != "json":
+        raise ValueError(
+            f"encoding should be 'auto', 'binary' or 'json' not {encoding!r}."
+        )
+
+    # Everything that can fail outside of the spectra themselves is computed
+    # before the file is opened.
+    wvl_payload = dump_json(wvlmodel, indent=False)
+    vertices_payload = orjson.dumps(outline_vertices(pts))
+
+    # The group is streamed to disk one spectrum at a time, in the layout of
+    # a SpectrumGroup dump, so the whole document is never held in memory.
+    # Spectra share the group's wavelength, so it is only written once.
+    with _replace_on_success(save_path, buffering=1 << 20) as f:
+        f.write(b'{"name":' + orjson.dumps(name) + b',"spectra":[')
+        for n, (spec, (px, py)) in enumerate(zip(spec_data, pts)):
+            if n > 0:
+                f.write(b",")
+            f.write(
+                orjson.dumps(
+                    {
+                        "name": f"{name}_{n:04d}",
+                        "spectrum": spec,
+                        "bbl_applied": False,
+                        "pixel": {"x": float(px), "y": float(py)},
+                    },
+                    option=orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+        f.write(b'],"spectra_pts":' + orjson.dumps(pts))
+        f.write(b',"wavelength":' + wvl_payload)
+        f.write(b',"polygon_vertices":' + vertices_payload)
+        f.write(b',"nspectra":' + orjson.dumps(len(spec_data)))
+        f.write(b',"bbl_applied":false}')
         logger.debug(f"Wrote SpectrumGroup to {save_path}.")
 
     return None
@@ -250,10 +448,7 @@ def write_spec3D(
     geodata_fp: Optional[PathLike] = None,
 ) -> None:
     wvlmodel = resolve_wvlmodel(wvl)
-    with rio.open(raster_fp, "r") as f:
-        height: int = f.height
-        width: int = f.width
-        count: int = f.count
+    height, width, count = _raster_shape(raster_fp)
     if count != wvlmodel.nbands:
         raise ValueError(
             f"Loaded raster data ({count}) does not have the same number of "
@@ -269,9 +464,9 @@ def write_spec3D(
         )
         file_suffix = ".spcub"
     else:
-        with open(geodata_fp, "r") as f:
-            geojson_str = f.read()
-        geodat = BaseGeolocationModel.model_validate_json(geojson_str)
+        geodat = BaseGeolocationModel.model_validate(
+            orjson.loads(Path(geodata_fp).read_bytes())
+        )
         spec3dmodel = GeoSpectrum3D(
             name=name,
             wavelength=wvlmodel,
@@ -282,14 +477,11 @@ def write_spec3D(
         )
         file_suffix = ".geospcub"
 
-    if Path(fp).is_dir():
-        save_path = Path(fp, name).with_suffix(file_suffix)
-    else:
-        save_path = Path(fp).with_suffix(file_suffix)
-
-    json_str = spec3dmodel.model_dump_json(indent=2)
-    with open(save_path, "w") as f:
-        f.write(json_str)
+    save_path = _resolve_save_path(fp, name, file_suffix)
+    # Cube pointer files are machine-read, so they are left unindented.
+    payload = dump_json(spec3dmodel, indent=False)
+    with open(save_path, "wb") as f:
+        f.write(payload)
 
 
 def write_wvl(
@@ -300,22 +492,22 @@ def write_wvl(
 ) -> None:
     # Ensuring wvl_values is a list
     if isinstance(wvl_values, np.ndarray):
-        wvl_values = list(wvl_values)
+        wvl_values = wvl_values.tolist()
 
     # Creating WvlModel
     if bbl is None:
-        bbl_vals = list(np.ones(len(wvl_values), dtype=bool))
+        bbl_vals = [True] * len(wvl_values)
     else:
         if isinstance(bbl, np.ndarray):
-            bbl_vals = list(bbl)
+            bbl_vals = bbl.tolist()
         else:
             bbl_vals = bbl
 
     wvl = WvlModel(values=wvl_values, unit=wvl_unit, bbl=bbl_vals)
 
     # Dumping data to JSON
-    json_string = wvl.model_dump_json(indent=2)
+    payload = dump_json(wvl)
     out_path = Path(fp).with_suffix(".wvl")
-    with open(out_path, "w") as f:
-        f.write(json_string)
+    with open(out_path, "wb") as f:
+        f.write(payload)
     logger.info("Wrote wavelength file: %s", out_path)
@@ -3,7 +3,7 @@ import logging
 from typing import Optional
 
 # Dependencies
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 import numpy as np
 
 # Relative Imports
@@ -13,6 +13,28 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+# (scale, reciprocal) for each (from, to) unit pair. A conversion is either
+# values * scale or, to or from wavenumber, scale / values.
+_UNIT_CONVERSIONS: dict[tuple[WvlUnit, WvlUnit], tuple[float, bool]] = {
+    ("nm", "nm"): (1.0, False),
+    ("nm", "um"): (1e-3, False),
+    ("nm", "m"): (1e-9, False),
+    ("nm", "v"): (1e9, True),
+    ("um", "nm"): (1e3, False),
+    ("um", "um"): (1.0, False),
+    ("um", "m"): (1e-6, False),
+    ("um", "v"): (1e6, True),
+    ("m", "nm"): (1e9, False),
+    ("m", "um"): (1e6, False),
+    ("m", "m"): (1.0, False),
+    ("m", "v"): (1.0, True),
+    ("v", "nm"): (1e9, True),
+    ("v", "um"): (1e6, True),
+    ("v", "m"): (1.0, True),
+    ("v", "v"): (1.0, False),
+}
+
+
 class WvlModel(BaseModel):
     """
     Object representing the wavelength values of a spectrum.
@@ -44,13 +66,17 @@ class WvlModel(BaseModel):
     resolution: float = Field(default=0.0)
     nbands: int = Field(default=0)
     ngoodbands: int = Field(default=0)
+    _np_values: Optional[np.ndarray] = PrivateAttr(default=None)
+    _np_values_src: Optional[list[float]] = PrivateAttr(default=None)
+    _good_band_idx: Optional[np.ndarray] = PrivateAttr(default=None)
+    _good_band_idx_src: Optional[list[bool]] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
     def set_resolution(self):
-        arr = np.asarray(self.values)
-        self.resolution = float((np.max(arr) - np.min(arr)) / arr.size)
-        self.nbands = int(len(self.values))
-        self.ngoodbands = int(np.count_nonzero(np.asarray(self.bbl)))
+        arr = self.np_values
+        self.resolution = float(np.ptp(arr) / arr.size) if arr.size else 0.0
+        self.nbands = len(self.values)
+        self.ngoodbands = sum(self.bbl)
         return self
 
     @classmethod
@@ -62,18 +88,64 @@ class WvlModel(BaseModel):
     ) -> "WvlModel":
         if bbl is None:
             bbl = [True] * values.size
-        return cls(values=list(values), unit=unit, bbl=bbl)
+        return cls(values=values.tolist(), unit=unit, bbl=bbl)
+
+    @property
+    def np_values(self) -> np.ndarray:
+        """
+        Read-only array of the wavelength values.
+
+        The array is cached and rebuilt whenever `values` is reassigned.
+        In-place edits of the `values` list are not tracked.
+        """
+        if self._np_values is None or self._np_values_src is not self.values:
+            self._cache_values(np.asarray(self.values, dtype=np.float64))
+        return self._np_values  # type: ignore
+
+    @property
+    def good_band_idx(self) -> np.ndarray:
+        """
+        Read-only array of the indices of the good bands in `bbl`.
+
+        Like `np_values`, the array is cached until `bbl` is reassigned.
+        """
+        if (
+            self._good_band_idx is None
+            or self._good_band_idx_src is not self.bbl
+        ):
+            idx = np.flatnonzero(self.bbl)
+            idx.flags.writeable = False
+            self._good_band_idx = idx
+            self._good_band_idx_src = self.bbl
+        return self._good_band_idx
+
+    def _cache_values(self, arr: np.ndarray) -> None:
+        arr.flags.writeable = False
+        self._np_values = arr
+        self._np_values_src = self.values
+
+    def _set_values(self, arr: np.ndarray) -> None:
+        """Replaces `values` with `arr`, keeping `arr` as the cached array."""
+        self.values = arr.tolist()
+        self._cache_values(arr)
+
+    def __eq__(self, other: object) -> bool:
+        # The private attributes only cache arrays derived from the fields,
+        # and can't be compared with ==, so only the fields are compared.
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
 
     def __array__(self):
-        return np.asarray(self.values)
+        return self.np_values.copy()
 
     def __getitem__(self, idx):
-        return np.asarray(self.values)[idx]
+        return self.np_values[idx].copy()
 
     def __setitem__(self, idx, value):
-        arr = np.asarray(self.values)
+        arr = self.np_values.copy()
         arr[idx] = value
-        self.values = arr.tolist()
+        self._set_values(arr)
 
     def __len__(self):
         return len(self.values)
@@ -92,97 +164,52 @@ class WvlModel(BaseModel):
             bands specified in `bbl`.
         """
         if bbl:
-            return np.asarray(self.values)[np.asarray(self.bbl)]
+            return self.np_values[self.good_band_idx]
         else:
-            return np.asarray(self.values)
+            return self.np_values.copy()
 
     def applybbl(self):
         """
         Removes bad bands from wavelength values list.
         """
-        return [i for i in self.asarray(bbl=True)]
+        return self.asarray(bbl=True).tolist()
 
     def to_nm(self):
         """
         Converts the wavelength values to nanometers.
         """
-        arr = np.asarray(self.values)
-        if self.unit == "nm":
-            pass
-        elif self.unit == "um":
-            arr *= 10**3
-        elif self.unit == "m":
-            arr *= 10**9
-        elif self.unit == "v":
-            arr = 10**9 / arr
-
-        self.values = list(arr)
-        self.unit = "nm"
-        logger.debug(f"{id(self)} was converted to nm")
+        self.convert_to("nm")
 
     def to_um(self):
         """
         Converts the wavelength values to microns.
         """
-        arr = np.asarray(self.values)
-        if self.unit == "nm":
-            arr *= 10**-3
-        elif self.unit == "um":
-            pass
-        elif self.unit == "m":
-            arr *= 10**6
-        elif self.unit == "v":
-            arr = 10**6 / arr
-
-        self.values = list(arr)
-        self.unit = "um"
-        logger.debug(f"{id(self)} was converted to um")
+        self.convert_to("um")
 
     def to_m(self):
         """
         Converts the wavelength values to meters.
         """
-        arr = np.asarray(self.values)
-        if self.unit == "nm":
-            arr *= 10**-9
-        elif self.unit == "um":
-            arr *= 10**-6
-        elif self.unit == "m":
-            pass
-        elif self.unit == "v":
-            arr = 1 / arr
-
-        self.values = list(arr)
-        self.unit = "m"
-        logger.debug(f"{id(self)} was converted to m")
+        self.convert_to("m")
 
     def to_v(self):
         """
         Converts the wavelength values to wavenumber.
         """
-        arr = np.asarray(self.values)
-        if self.unit == "nm":
-            arr = 10**9 / arr
-        elif self.unit == "um":
-            arr = 10**6 / arr
-        elif self.unit == "m":
-            arr = 1 / arr
-        elif self.unit == "v":
-            pass
-
-        self.values = list(arr)
-        self.unit = "v"
-        logger.debug(f"{id(self)} was converted to v")
+        self.convert_to("v")
 
     def convert_to(self, unit: WvlUnit):
-        if unit == "nm":
-            self.to_nm()
-        elif unit == "um":
-            self.to_um()
-        elif unit == "m":
-            self.to_m()
-        elif unit == "v":
-            self.to_v()
+        """
+        Converts the wavelength values to `unit`.
+        """
+        if unit == self.unit:
+            return
+        scale, reciprocal = _UNIT_CONVERSIONS[(self.unit, unit)]
+        arr = scale / self.np_values if reciprocal else self.np_values * scale
+
+        self._set_values(arr)
+        self.unit = unit
+        logger.debug(f"{id(self)} was converted to {unit}")
 
     def find(
         self, wvl_guess: float | int, unit: WvlUnit
@@ -204,9 +231,20 @@ class WvlModel(BaseModel):
         exact_wvl_value: float
             Exact value of the found wavelength.
         """
-        _current_unit = self.unit
-        self.convert_to(unit)
-        arr = self.asarray()
-        idx = np.argmin(abs(arr - wvl_guess))
-        self.convert_to(_current_unit)
+        scale, reciprocal = _UNIT_CONVERSIONS[(self.unit, unit)]
+        # All arithmetic happens in place on one temporary array of the good
+        # band values.
+        dist = np.take(self.np_values, self.good_band_idx)
+        if reciprocal:
+            # Converting to or from wavenumber is not linear, so distances are
+            # measured after converting the values to the unit of the guess.
+            np.divide(scale, dist, out=dist)
+            np.subtract(dist, wvl_guess, out=dist)
+        else:
+            # A linear conversion doesn't change which value is closest, so
+            # only the guess is converted.
+            np.subtract(dist, wvl_guess / scale, out=dist)
+        np.abs(dist, out=dist)
+        # argmin indexes the good bands; map it back to the full band list.
+        idx = self.good_band_idx[dist.argmin()]
         return idx, self.values[idx]